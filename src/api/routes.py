@@ -1,6 +1,11 @@
-from typing import List, Optional
+from pathlib import Path
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
+from pydantic import BaseModel, ConfigDict
 
 from ..domain.psychological_expert import (
     PsychologicalExpert,
@@ -9,65 +14,105 @@ from ..domain.psychological_expert import (
     SessionType,
 )
 from ..domain.psychological_expert_factory import PsychologicalExpertFactory
-from ..domain.session_manager import SessionManager, SessionState, ClientHistory
+from ..domain.session_manager import (
+    SessionManager,
+    SessionState,
+    SessionRecord,
+    ClientHistory,
+)
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+# Sync dependencies run concurrently in the threadpool, so the process-wide
+# instances are created eagerly or under a lock, never once per racing request
+_session_manager = SessionManager()
+_expert_factory: Optional[PsychologicalExpertFactory] = None
+_expert_factory_lock = threading.Lock()
+
+
+def get_expert_factory() -> PsychologicalExpertFactory:
+    """Get the process-wide expert factory, loading expert data on first use."""
+    global _expert_factory
+    if _expert_factory is None:
+        with _expert_factory_lock:
+            if _expert_factory is None:
+                _expert_factory = PsychologicalExpertFactory(
+                    Path("data/psychological_experts.json")
+                )
+    return _expert_factory
 
-router = APIRouter()
-session_manager = SessionManager()
-expert_factory = PsychologicalExpertFactory("data/psychological_experts.json")
+
+def get_session_manager() -> SessionManager:
+    """Get the process-wide session manager."""
+    return _session_manager
 
 
 # --- Expert Selection Endpoints ---
 
 class ExpertResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str
     name: str
-    specializations: List[str]
-    therapeutic_approaches: List[str]
+    specializations: List[SpecializationArea]
+    therapeutic_approaches: List[TherapeuticApproach]
     communication_style: str
 
 
+# Serialized expert payloads per factory instance, tagged with the expert
+# tuple they were built from so a reload of the factory rebuilds them
+_PayloadCacheEntry = Tuple[Tuple[PsychologicalExpert, ...], Dict[str, dict]]
+_expert_payloads: "WeakKeyDictionary[PsychologicalExpertFactory, _PayloadCacheEntry]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_expert_payloads(
+    factory: PsychologicalExpertFactory = Depends(get_expert_factory),
+) -> Dict[str, dict]:
+    """Get every expert's serialized ExpertResponse, keyed by expert ID.
+
+    Expert data is static once loaded, so payloads are built once per load.
+    """
+    experts = factory.get_all_experts()
+    cached = _expert_payloads.get(factory)
+    if cached is None or cached[0] is not experts:
+        cached = (
+            experts,
+            {
+                expert.id: ExpertResponse.model_validate(expert).model_dump(mode="json")
+                for expert in experts
+            },
+        )
+        _expert_payloads[factory] = cached
+    return cached[1]
+
+
 @router.get("/experts", response_model=List[ExpertResponse])
 async def get_experts(
     specialization: Optional[SpecializationArea] = None,
     approach: Optional[TherapeuticApproach] = None,
     session_type: Optional[SessionType] = None,
+    factory: PsychologicalExpertFactory = Depends(get_expert_factory),
+    payloads: Dict[str, dict] = Depends(get_expert_payloads),
 ):
     """Get available experts with optional filtering."""
-    experts = expert_factory.get_all_experts()
-    
-    if specialization:
-        experts = [e for e in experts if e.has_specialization(specialization)]
-    if approach:
-        experts = [e for e in experts if e.uses_therapeutic_approach(approach)]
-    if session_type:
-        experts = [e for e in experts if e.can_handle_session_type(session_type)]
-    
-    return [
-        ExpertResponse(
-            id=e.id,
-            name=e.name,
-            specializations=[s.value for s in e.specializations],
-            therapeutic_approaches=[t.value for t in e.therapeutic_approaches],
-            communication_style=e.communication_style,
-        )
-        for e in experts
-    ]
+    experts = factory.filter_experts(specialization, approach, session_type)
+    return ORJSONResponse([payloads[e.id] for e in experts])
 
 
 @router.get("/experts/{expert_id}", response_model=ExpertResponse)
-async def get_expert(expert_id: str):
+async def get_expert(
+    expert_id: str,
+    payloads: Dict[str, dict] = Depends(get_expert_payloads),
+):
     """Get a specific expert by ID."""
-    expert = expert_factory.get_expert_by_id(expert_id)
-    if not expert:
+    payload = payloads.get(expert_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Expert not found")
-    
-    return ExpertResponse(
-        id=expert.id,
-        name=expert.name,
-        specializations=[s.value for s in expert.specializations],
-        therapeutic_approaches=[t.value for t in expert.therapeutic_approaches],
-        communication_style=expert.communication_style,
-    )
+
+    return ORJSONResponse(payload)
 
 
 # --- Session Management Endpoints ---
@@ -80,6 +125,8 @@ class SessionRequest(BaseModel):
 
 
 class SessionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     session_id: str
     expert_id: str
     client_id: str
@@ -92,10 +139,19 @@ class SessionResponse(BaseModel):
     homework_assigned: List[str]
 
 
+def _session_payload(session: Union[SessionState, SessionRecord]) -> dict:
+    """Serialize a live or archived session as SessionResponse JSON data."""
+    return SessionResponse.model_validate(session).model_dump(mode="json")
+
+
 @router.post("/sessions", response_model=SessionResponse)
-async def create_session(request: SessionRequest):
+def create_session(
+    request: SessionRequest,
+    factory: PsychologicalExpertFactory = Depends(get_expert_factory),
+    session_manager: SessionManager = Depends(get_session_manager),
+):
     """Start a new therapy session."""
-    expert = expert_factory.get_expert_by_id(request.expert_id)
+    expert = factory.get_expert_by_id(request.expert_id)
     if not expert:
         raise HTTPException(status_code=404, detail="Expert not found")
     
@@ -111,19 +167,8 @@ async def create_session(request: SessionRequest):
         session_type=request.session_type,
         initial_focus=request.initial_focus,
     )
-    
-    return SessionResponse(
-        session_id=session.session_id,
-        expert_id=session.expert_id,
-        client_id=session.client_id,
-        session_type=session.session_type,
-        current_focus=session.current_focus,
-        progress_notes=session.progress_notes,
-        risk_level=session.risk_level,
-        completed_steps=session.completed_steps,
-        next_steps=session.next_steps,
-        homework_assigned=session.homework_assigned,
-    )
+
+    return ORJSONResponse(session.cached_view(_session_payload))
 
 
 class SessionUpdateRequest(BaseModel):
@@ -135,7 +180,11 @@ class SessionUpdateRequest(BaseModel):
 
 
 @router.put("/sessions/{session_id}", response_model=SessionResponse)
-async def update_session(session_id: str, request: SessionUpdateRequest):
+def update_session(
+    session_id: str,
+    request: SessionUpdateRequest,
+    session_manager: SessionManager = Depends(get_session_manager),
+):
     """Update an active session's progress."""
     session = session_manager.update_session_progress(
         session_id=session_id,
@@ -145,23 +194,16 @@ async def update_session(session_id: str, request: SessionUpdateRequest):
         next_step=request.next_step,
         homework=request.homework,
     )
-    
-    return SessionResponse(
-        session_id=session.session_id,
-        expert_id=session.expert_id,
-        client_id=session.client_id,
-        session_type=session.session_type,
-        current_focus=session.current_focus,
-        progress_notes=session.progress_notes,
-        risk_level=session.risk_level,
-        completed_steps=session.completed_steps,
-        next_steps=session.next_steps,
-        homework_assigned=session.homework_assigned,
-    )
+
+    return ORJSONResponse(session.cached_view(_session_payload))
 
 
 @router.post("/sessions/{session_id}/end")
-async def end_session(session_id: str, summary: str):
+def end_session(
+    session_id: str,
+    summary: str,
+    session_manager: SessionManager = Depends(get_session_manager),
+):
     """End an active session."""
     try:
         session = session_manager.end_session(session_id, summary)
@@ -173,6 +215,8 @@ async def end_session(session_id: str, summary: str):
 # --- Client Management Endpoints ---
 
 class ClientHistoryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     client_id: str
     sessions: List[SessionResponse]
     treatment_goals: List[str]
@@ -180,33 +224,39 @@ class ClientHistoryResponse(BaseModel):
     progress_metrics: dict
 
 
+def _stream_client_history(history: ClientHistory) -> Iterator[bytes]:
+    """Yield a client history as ClientHistoryResponse JSON, one session at a time.
+
+    The history must be a snapshot, since streaming runs after the handler returns.
+    """
+    yield b'{"client_id":' + orjson.dumps(history.client_id) + b',"sessions":['
+    for i, session in enumerate(history.sessions):
+        if i:
+            yield b","
+        yield orjson.dumps(_session_payload(session))
+    yield (
+        b'],"treatment_goals":' + orjson.dumps(history.treatment_goals)
+        + b',"risk_assessments":' + orjson.dumps(history.risk_assessments)
+        + b',"progress_metrics":'
+        + orjson.dumps(
+            {name: series.tolist() for name, series in history.progress_metrics.items()}
+        )
+        + b"}"
+    )
+
+
 @router.get("/clients/{client_id}/history", response_model=ClientHistoryResponse)
-async def get_client_history(client_id: str):
+def get_client_history(
+    client_id: str,
+    session_manager: SessionManager = Depends(get_session_manager),
+):
     """Get a client's therapy history."""
-    history = session_manager.get_client_history(client_id)
+    history = session_manager.get_client_history_snapshot(client_id)
     if not history:
         raise HTTPException(status_code=404, detail="Client history not found")
-    
-    return ClientHistoryResponse(
-        client_id=history.client_id,
-        sessions=[
-            SessionResponse(
-                session_id=s.session_id,
-                expert_id=s.expert_id,
-                client_id=s.client_id,
-                session_type=s.session_type,
-                current_focus=s.current_focus,
-                progress_notes=s.progress_notes,
-                risk_level=s.risk_level,
-                completed_steps=s.completed_steps,
-                next_steps=s.next_steps,
-                homework_assigned=s.homework_assigned,
-            )
-            for s in history.sessions
-        ],
-        treatment_goals=history.treatment_goals,
-        risk_assessments=history.risk_assessments,
-        progress_metrics=history.progress_metrics,
+
+    return StreamingResponse(
+        _stream_client_history(history), media_type="application/json"
     )
 
 
@@ -215,7 +265,11 @@ class TreatmentGoalsRequest(BaseModel):
 
 
 @router.put("/clients/{client_id}/goals")
-async def update_treatment_goals(client_id: str, request: TreatmentGoalsRequest):
+def update_treatment_goals(
+    client_id: str,
+    request: TreatmentGoalsRequest,
+    session_manager: SessionManager = Depends(get_session_manager),
+):
     """Update a client's treatment goals."""
     history = session_manager.update_treatment_goals(client_id, request.goals)
     return {"message": "Treatment goals updated successfully"}
@@ -226,7 +280,11 @@ class RiskAssessmentRequest(BaseModel):
 
 
 @router.post("/clients/{client_id}/risk-assessment")
-async def add_risk_assessment(client_id: str, request: RiskAssessmentRequest):
+def add_risk_assessment(
+    client_id: str,
+    request: RiskAssessmentRequest,
+    session_manager: SessionManager = Depends(get_session_manager),
+):
     """Add a risk assessment to a client's history."""
     history = session_manager.add_risk_assessment(client_id, request.assessment)
     return {"message": "Risk assessment added successfully"}
@@ -238,7 +296,11 @@ class ProgressMetricRequest(BaseModel):
 
 
 @router.post("/clients/{client_id}/progress")
-async def update_progress_metric(client_id: str, request: ProgressMetricRequest):
+def update_progress_metric(
+    client_id: str,
+    request: ProgressMetricRequest,
+    session_manager: SessionManager = Depends(get_session_manager),
+):
     """Update a client's progress metrics."""
     history = session_manager.update_progress_metrics(
         client_id, request.metric_name, request.value
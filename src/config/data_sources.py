@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -15,6 +16,8 @@ class SourceType(str, Enum):
 
 class SourceAccess(BaseModel):
     """Represents access configuration for a data source."""
+    model_config = ConfigDict(frozen=True)
+
     requires_auth: bool = False
     api_key: Optional[str] = None
     credentials: Optional[Dict[str, str]] = None
@@ -24,6 +27,8 @@ class SourceAccess(BaseModel):
 
 class DataSource(BaseModel):
     """Represents a data source for training and RAG."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     type: SourceType
@@ -38,26 +43,30 @@ class DataSource(BaseModel):
     is_active: bool = True
 
 
+# The catalog below is literal and trusted, so entries are built with
+# model_construct to skip validation. Data sources from any other origin should
+# go through the validating DataSource constructor.
+
 # Research Databases
 RESEARCH_DATABASES = [
-    DataSource(
+    DataSource.model_construct(
         id="pubmed",
         name="PubMed Central",
         type=SourceType.RESEARCH_DATABASE,
         description="Open access medical and psychological research database",
         url="https://www.ncbi.nlm.nih.gov/pmc/",
-        access=SourceAccess(requires_auth=False),
+        access=SourceAccess.model_construct(requires_auth=False),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=0.95,
     ),
-    DataSource(
+    DataSource.model_construct(
         id="psycinfo",
         name="PsycINFO",
         type=SourceType.RESEARCH_DATABASE,
         description="American Psychological Association's database",
         url="https://www.apa.org/pubs/databases/psycinfo",
-        access=SourceAccess(requires_auth=True),
+        access=SourceAccess.model_construct(requires_auth=True),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=0.98,
@@ -66,24 +75,24 @@ RESEARCH_DATABASES = [
 
 # Professional Guidelines
 PROFESSIONAL_GUIDELINES = [
-    DataSource(
+    DataSource.model_construct(
         id="apa_guidelines",
         name="APA Guidelines",
         type=SourceType.PROFESSIONAL_GUIDELINE,
         description="American Psychological Association Clinical Practice Guidelines",
         url="https://www.apa.org/practice/guidelines",
-        access=SourceAccess(requires_auth=True),
+        access=SourceAccess.model_construct(requires_auth=True),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=0.99,
     ),
-    DataSource(
+    DataSource.model_construct(
         id="who_mental_health",
         name="WHO Mental Health Guidelines",
         type=SourceType.PROFESSIONAL_GUIDELINE,
         description="World Health Organization Mental Health Guidelines",
         url="https://www.who.int/mental_health/",
-        access=SourceAccess(requires_auth=False),
+        access=SourceAccess.model_construct(requires_auth=False),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=0.97,
@@ -92,24 +101,24 @@ PROFESSIONAL_GUIDELINES = [
 
 # Treatment Protocols
 TREATMENT_PROTOCOLS = [
-    DataSource(
+    DataSource.model_construct(
         id="cbt_manual",
         name="CBT Treatment Manual",
         type=SourceType.TREATMENT_PROTOCOL,
         description="Evidence-based CBT treatment protocols",
         url="https://www.apa.org/pubs/books/cbt-manual",
-        access=SourceAccess(requires_auth=True),
+        access=SourceAccess.model_construct(requires_auth=True),
         specializations=["anxiety", "depression", "trauma"],
         therapeutic_approaches=["cbt"],
         reliability_score=0.96,
     ),
-    DataSource(
+    DataSource.model_construct(
         id="dbt_skills",
         name="DBT Skills Manual",
         type=SourceType.TREATMENT_PROTOCOL,
         description="Dialectical Behavior Therapy skills training manual",
         url="https://www.apa.org/pubs/books/dbt-manual",
-        access=SourceAccess(requires_auth=True),
+        access=SourceAccess.model_construct(requires_auth=True),
         specializations=["personality_disorders", "trauma"],
         therapeutic_approaches=["dbt"],
         reliability_score=0.95,
@@ -118,24 +127,24 @@ TREATMENT_PROTOCOLS = [
 
 # Clinical Documentation
 CLINICAL_DOCUMENTS = [
-    DataSource(
+    DataSource.model_construct(
         id="assessment_templates",
         name="Clinical Assessment Templates",
         type=SourceType.CLINICAL_DOCUMENT,
         description="Standardized clinical assessment forms and templates",
         url="https://www.apa.org/practice/assessment",
-        access=SourceAccess(requires_auth=True),
+        access=SourceAccess.model_construct(requires_auth=True),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=0.94,
     ),
-    DataSource(
+    DataSource.model_construct(
         id="progress_notes",
         name="Progress Note Templates",
         type=SourceType.CLINICAL_DOCUMENT,
         description="Standardized progress note templates",
         url="https://www.apa.org/practice/notes",
-        access=SourceAccess(requires_auth=True),
+        access=SourceAccess.model_construct(requires_auth=True),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=0.93,
@@ -144,13 +153,13 @@ CLINICAL_DOCUMENTS = [
 
 # Case Studies
 CASE_STUDIES = [
-    DataSource(
+    DataSource.model_construct(
         id="clinical_cases",
         name="Clinical Case Database",
         type=SourceType.CASE_STUDY,
         description="Anonymized clinical cases and treatment outcomes",
         url="https://www.apa.org/practice/cases",
-        access=SourceAccess(requires_auth=True),
+        access=SourceAccess.model_construct(requires_auth=True),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=0.92,
@@ -159,13 +168,13 @@ CASE_STUDIES = [
 
 # Ethical Guidelines
 ETHICAL_GUIDELINES = [
-    DataSource(
+    DataSource.model_construct(
         id="apa_ethics",
         name="APA Ethical Guidelines",
         type=SourceType.ETHICAL_GUIDELINE,
         description="American Psychological Association Ethical Guidelines",
         url="https://www.apa.org/ethics",
-        access=SourceAccess(requires_auth=False),
+        access=SourceAccess.model_construct(requires_auth=False),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=1.0,
@@ -174,13 +183,13 @@ ETHICAL_GUIDELINES = [
 
 # Legal Framework
 LEGAL_FRAMEWORK = [
-    DataSource(
+    DataSource.model_construct(
         id="hipaa",
         name="HIPAA Guidelines",
         type=SourceType.LEGAL_FRAMEWORK,
         description="Health Insurance Portability and Accountability Act",
         url="https://www.hhs.gov/hipaa",
-        access=SourceAccess(requires_auth=False),
+        access=SourceAccess.model_construct(requires_auth=False),
         specializations=["all"],
         therapeutic_approaches=["all"],
         reliability_score=1.0,
@@ -198,23 +207,36 @@ ALL_SOURCES = (
     + LEGAL_FRAMEWORK
 )
 
-# Create lookup dictionaries
-SOURCES_BY_ID = {source.id: source for source in ALL_SOURCES}
-SOURCES_BY_TYPE = {
-    source_type: [s for s in ALL_SOURCES if s.type == source_type]
-    for source_type in SourceType
+# Build lookup indices in a single pass over all sources
+SOURCES_BY_ID: Dict[str, DataSource] = {}
+_sources_by_type: Dict[SourceType, List[DataSource]] = {
+    source_type: [] for source_type in SourceType
 }
-SOURCES_BY_SPECIALIZATION = {}
-SOURCES_BY_APPROACH = {}
+_sources_by_specialization: Dict[str, List[DataSource]] = defaultdict(list)
+_sources_by_approach: Dict[str, List[DataSource]] = defaultdict(list)
+
+# Bit i of a mask is set when ALL_SOURCES[i] covers the specialization/approach
+SPECIALIZATION_MASKS: Dict[str, int] = {}
+APPROACH_MASKS: Dict[str, int] = {}
+
+for index, source in enumerate(ALL_SOURCES):
+    SOURCES_BY_ID[source.id] = source
+    _sources_by_type[source.type].append(source)
 
-# Build specialization and approach indices
-for source in ALL_SOURCES:
     for spec in source.specializations:
-        if spec not in SOURCES_BY_SPECIALIZATION:
-            SOURCES_BY_SPECIALIZATION[spec] = []
-        SOURCES_BY_SPECIALIZATION[spec].append(source)
-    
+        _sources_by_specialization[spec].append(source)
+        SPECIALIZATION_MASKS[spec] = SPECIALIZATION_MASKS.get(spec, 0) | 1 << index
+
     for approach in source.therapeutic_approaches:
-        if approach not in SOURCES_BY_APPROACH:
-            SOURCES_BY_APPROACH[approach] = []
-        SOURCES_BY_APPROACH[approach].append(source) 
\ No newline at end of file
+        _sources_by_approach[approach].append(source)
+        APPROACH_MASKS[approach] = APPROACH_MASKS.get(approach, 0) | 1 << index
+
+SOURCES_BY_TYPE: Dict[SourceType, Tuple[DataSource, ...]] = {
+    source_type: tuple(sources) for source_type, sources in _sources_by_type.items()
+}
+SOURCES_BY_SPECIALIZATION: Dict[str, Tuple[DataSource, ...]] = {
+    spec: tuple(sources) for spec, sources in _sources_by_specialization.items()
+}
+SOURCES_BY_APPROACH: Dict[str, Tuple[DataSource, ...]] = {
+    approach: tuple(sources) for approach, sources in _sources_by_approach.items()
+}
@@ -1,9 +1,14 @@
-from typing import Dict, List, Optional, Tuple
-import json
+from typing import Dict, List, Optional, Sequence, Tuple
+import bisect
 from datetime import datetime
+from functools import lru_cache, partial
 import logging
+import mmap
 from pathlib import Path
 
+import anyio
+import orjson
+
 from ..config.data_sources import (
     DataSource,
     SourceType,
@@ -12,8 +17,29 @@ from ..config.data_sources import (
     SOURCES_BY_TYPE,
     SOURCES_BY_SPECIALIZATION,
     SOURCES_BY_APPROACH,
+    SPECIALIZATION_MASKS,
+    APPROACH_MASKS,
 )
 
+# Lower bounds of the reliability buckets above the lowest one, and the label
+# of each bucket in ascending order
+_RELIABILITY_BOUNDS = (0.5, 0.6, 0.7, 0.8, 0.9)
+_RELIABILITY_LABELS = ("0.0-0.5", "0.5-0.6", "0.6-0.7", "0.7-0.8", "0.8-0.9", "0.9-1.0")
+
+
+@lru_cache(maxsize=64)
+def _read_cache_file(cache_file: Path, mtime_ns: int, size: int, inode: int) -> Dict:
+    """Decode a cache file through a read-only memory map.
+
+    Memoized on the file's modification time, size and inode, so an unchanged
+    file is only decoded once while rewrites and replacements are picked up.
+    The returned data is shared and must not be modified.
+    """
+    with open(cache_file, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
 
 class DataSourceManager:
     """Manages data sources and RAG implementation for psychological experts."""
@@ -23,17 +49,17 @@ class DataSourceManager:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
 
-    def get_sources_by_specialization(self, specialization: str) -> List[DataSource]:
+    def get_sources_by_specialization(self, specialization: str) -> Sequence[DataSource]:
         """Get all data sources for a specific specialization."""
-        return SOURCES_BY_SPECIALIZATION.get(specialization, [])
+        return SOURCES_BY_SPECIALIZATION.get(specialization, ())
 
-    def get_sources_by_approach(self, approach: str) -> List[DataSource]:
+    def get_sources_by_approach(self, approach: str) -> Sequence[DataSource]:
         """Get all data sources for a specific therapeutic approach."""
-        return SOURCES_BY_APPROACH.get(approach, [])
+        return SOURCES_BY_APPROACH.get(approach, ())
 
-    def get_sources_by_type(self, source_type: SourceType) -> List[DataSource]:
+    def get_sources_by_type(self, source_type: SourceType) -> Sequence[DataSource]:
         """Get all data sources of a specific type."""
-        return SOURCES_BY_TYPE.get(source_type, [])
+        return SOURCES_BY_TYPE.get(source_type, ())
 
     def get_source_by_id(self, source_id: str) -> Optional[DataSource]:
         """Get a specific data source by ID."""
@@ -46,20 +72,19 @@ class DataSourceManager:
         min_reliability: float = 0.8,
     ) -> List[DataSource]:
         """Get relevant data sources based on specializations and approaches."""
-        relevant_sources = set()
-        
-        # Add sources for each specialization
+        # Union the per-specialization and per-approach source bitmasks
+        mask = 0
         for spec in specializations:
-            relevant_sources.update(self.get_sources_by_specialization(spec))
-        
-        # Add sources for each approach
+            mask |= SPECIALIZATION_MASKS.get(spec, 0)
         for approach in approaches:
-            relevant_sources.update(self.get_sources_by_approach(approach))
-        
+            mask |= APPROACH_MASKS.get(approach, 0)
+
         # Filter by reliability score
         return [
-            source for source in relevant_sources
-            if source.reliability_score >= min_reliability and source.is_active
+            source for index, source in enumerate(ALL_SOURCES)
+            if mask >> index & 1
+            and source.reliability_score >= min_reliability
+            and source.is_active
         ]
 
     def get_source_content(
@@ -68,7 +93,11 @@ class DataSourceManager:
         query: Optional[str] = None,
         max_results: int = 10,
     ) -> List[Dict]:
-        """Get content from a specific data source."""
+        """Get content from a specific data source.
+
+        Items served from the cache are shared with later calls and must not
+        be modified.
+        """
         source = self.get_source_by_id(source_id)
         if not source:
             raise ValueError(f"Source {source_id} not found")
@@ -76,10 +105,12 @@ class DataSourceManager:
         # Check cache first
         cache_file = self.cache_dir / f"{source_id}.json"
         if cache_file.exists():
-            with open(cache_file) as f:
-                cached_data = json.load(f)
-                if self._is_cache_valid(cached_data, source):
-                    return self._filter_cached_content(cached_data, query, max_results)
+            stat = cache_file.stat()
+            cached_data = _read_cache_file(
+                cache_file, stat.st_mtime_ns, stat.st_size, stat.st_ino
+            )
+            if self._is_cache_valid(cached_data, source):
+                return self._filter_cached_content(cached_data, query, max_results)
         
         # TODO: Implement actual data source fetching
         # This would involve:
@@ -90,6 +121,17 @@ class DataSourceManager:
         
         return []
 
+    async def get_source_content_async(
+        self,
+        source_id: str,
+        query: Optional[str] = None,
+        max_results: int = 10,
+    ) -> List[Dict]:
+        """Get content from a specific data source without blocking the event loop."""
+        return await anyio.to_thread.run_sync(
+            partial(self.get_source_content, source_id, query, max_results)
+        )
+
     def update_source_cache(self, source_id: str) -> bool:
         """Update the cache for a specific data source."""
         source = self.get_source_by_id(source_id)
@@ -156,28 +198,9 @@ class DataSourceManager:
 
     def _get_reliability_distribution(self) -> Dict[str, int]:
         """Get distribution of reliability scores."""
-        distribution = {
-            "0.9-1.0": 0,
-            "0.8-0.9": 0,
-            "0.7-0.8": 0,
-            "0.6-0.7": 0,
-            "0.5-0.6": 0,
-            "0.0-0.5": 0,
-        }
-        
+        counts = [0] * len(_RELIABILITY_LABELS)
         for source in ALL_SOURCES:
-            score = source.reliability_score
-            if score >= 0.9:
-                distribution["0.9-1.0"] += 1
-            elif score >= 0.8:
-                distribution["0.8-0.9"] += 1
-            elif score >= 0.7:
-                distribution["0.7-0.8"] += 1
-            elif score >= 0.6:
-                distribution["0.6-0.7"] += 1
-            elif score >= 0.5:
-                distribution["0.5-0.6"] += 1
-            else:
-                distribution["0.0-0.5"] += 1
-        
-        return distribution 
\ No newline at end of file
+            counts[bisect.bisect_right(_RELIABILITY_BOUNDS, source.reliability_score)] += 1
+
+        # Highest bucket first
+        return dict(zip(reversed(_RELIABILITY_LABELS), reversed(counts)))
@@ -1,5 +1,5 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, FrozenSet, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from enum import Enum
 
 
@@ -47,6 +47,8 @@ class PsychologicalExpert(BaseModel):
         session_protocols (dict): Dictionary of session protocols for different session types
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique identifier for the expert")
     name: str = Field(description="Name of the expert")
     specializations: List[SpecializationArea] = Field(
@@ -65,6 +67,25 @@ class PsychologicalExpert(BaseModel):
         description="Dictionary of session protocols for different session types"
     )
 
+    # Membership sets derived from the fields above, built after validation and
+    # rebuilt by model_copy() so they always match the fields
+    _spec_set: FrozenSet[SpecializationArea] = PrivateAttr(default=frozenset())
+    _approach_set: FrozenSet[TherapeuticApproach] = PrivateAttr(default=frozenset())
+    _session_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+
+    def model_post_init(self, __context: Any) -> None:
+        self._spec_set = frozenset(self.specializations)
+        self._approach_set = frozenset(self.therapeutic_approaches)
+        self._session_set = frozenset(self.session_protocols.keys())
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "PsychologicalExpert":
+        """Copy the expert, rebuilding the membership sets from the copy's fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.model_post_init(None)
+        return copied
+
     def __str__(self) -> str:
         return (
             f"PsychologicalExpert(id={self.id}, name={self.name}, "
@@ -74,7 +95,7 @@ class PsychologicalExpert(BaseModel):
 
     def can_handle_session_type(self, session_type: SessionType) -> bool:
         """Check if the expert is qualified to handle a specific session type."""
-        return session_type in self.session_protocols
+        return session_type in self._session_set
 
     def get_session_protocol(self, session_type: SessionType) -> Optional[dict]:
         """Get the protocol for a specific session type."""
@@ -82,8 +103,8 @@ class PsychologicalExpert(BaseModel):
 
     def has_specialization(self, specialization: SpecializationArea) -> bool:
         """Check if the expert has a specific specialization."""
-        return specialization in self.specializations
+        return specialization in self._spec_set
 
     def uses_therapeutic_approach(self, approach: TherapeuticApproach) -> bool:
         """Check if the expert uses a specific therapeutic approach."""
-        return approach in self.therapeutic_approaches 
\ No newline at end of file
+        return approach in self._approach_set 
\ No newline at end of file
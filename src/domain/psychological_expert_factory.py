@@ -1,6 +1,9 @@
-import json
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+from pydantic import TypeAdapter
 
 from .psychological_expert import (
     PsychologicalExpert,
@@ -13,6 +16,8 @@ from .psychological_expert import (
 class PsychologicalExpertFactory:
     """Factory class for creating and managing psychological experts."""
 
+    _ADAPTER = TypeAdapter(List[PsychologicalExpert])
+
     def __init__(self, experts_data_path: Path):
         """Initialize the factory with the path to experts data.
 
@@ -21,30 +26,62 @@ class PsychologicalExpertFactory:
         """
         self.experts_data_path = experts_data_path
         self._experts: List[PsychologicalExpert] = []
+        self._experts_tuple: Tuple[PsychologicalExpert, ...] = ()
+        self._experts_by_id: Dict[str, PsychologicalExpert] = {}
+        self._by_specialization: Dict[
+            SpecializationArea, Tuple[PsychologicalExpert, ...]
+        ] = {}
+        self._by_approach: Dict[TherapeuticApproach, Tuple[PsychologicalExpert, ...]] = {}
+        self._by_session_type: Dict[str, Tuple[PsychologicalExpert, ...]] = {}
+        self._filter_cache: Dict[
+            Tuple[
+                Optional[SpecializationArea],
+                Optional[TherapeuticApproach],
+                Optional[SessionType],
+            ],
+            Tuple[PsychologicalExpert, ...],
+        ] = {}
         self._load_experts()
 
     def _load_experts(self) -> None:
-        """Load experts from the data file."""
+        """Load experts from the data file.
+
+        Every index is rebuilt from scratch and swapped in only once the whole
+        file has loaded, so a reload drops removed experts and stale filter
+        results, and a failed reload leaves the previous data in place.
+        """
         if not self.experts_data_path.exists():
             raise FileNotFoundError(
                 f"Experts data file not found at {self.experts_data_path}"
             )
 
-        with open(self.experts_data_path, "r") as f:
-            experts_data = json.load(f)
-
-        for expert_data in experts_data:
-            # Convert string values to enums
-            expert_data["specializations"] = [
-                SpecializationArea(s) for s in expert_data["specializations"]
-            ]
-            expert_data["therapeutic_approaches"] = [
-                TherapeuticApproach(t) for t in expert_data["therapeutic_approaches"]
-            ]
-            
-            # Create expert instance
-            expert = PsychologicalExpert(**expert_data)
-            self._experts.append(expert)
+        experts_data = orjson.loads(self.experts_data_path.read_bytes())
+
+        # Validate all records in one pass; string values are coerced to enums
+        experts = self._ADAPTER.validate_python(experts_data)
+
+        # Build ID, specialization, approach and session type indices
+        experts_by_id = {}
+        by_specialization = defaultdict(list)
+        by_approach = defaultdict(list)
+        by_session_type = defaultdict(list)
+        for expert in experts:
+            experts_by_id[expert.id] = expert
+            for spec in expert.specializations:
+                by_specialization[spec].append(expert)
+            for approach in expert.therapeutic_approaches:
+                by_approach[approach].append(expert)
+            for session_type in expert.session_protocols:
+                by_session_type[session_type].append(expert)
+
+        self._experts = experts
+        self._experts_tuple = tuple(experts)
+        self._experts_by_id = experts_by_id
+        # Freeze the buckets so callers can't modify the indices
+        self._by_specialization = {k: tuple(v) for k, v in by_specialization.items()}
+        self._by_approach = {k: tuple(v) for k, v in by_approach.items()}
+        self._by_session_type = {k: tuple(v) for k, v in by_session_type.items()}
+        self._filter_cache = {}
 
     def get_expert_by_id(self, expert_id: str) -> Optional[PsychologicalExpert]:
         """Get an expert by their ID.
@@ -55,64 +92,86 @@ class PsychologicalExpertFactory:
         Returns:
             Optional[PsychologicalExpert]: The expert if found, None otherwise
         """
-        for expert in self._experts:
-            if expert.id == expert_id:
-                return expert
-        return None
+        return self._experts_by_id.get(expert_id)
 
     def get_experts_by_specialization(
         self, specialization: SpecializationArea
-    ) -> List[PsychologicalExpert]:
+    ) -> Tuple[PsychologicalExpert, ...]:
         """Get all experts with a specific specialization.
 
         Args:
             specialization (SpecializationArea): The specialization to filter by
 
         Returns:
-            List[PsychologicalExpert]: List of experts with the specified specialization
+            Tuple[PsychologicalExpert, ...]: Experts with the specified specialization
         """
-        return [
-            expert for expert in self._experts if expert.has_specialization(specialization)
-        ]
+        return self._by_specialization.get(specialization, ())
 
     def get_experts_by_therapeutic_approach(
         self, approach: TherapeuticApproach
-    ) -> List[PsychologicalExpert]:
+    ) -> Tuple[PsychologicalExpert, ...]:
         """Get all experts using a specific therapeutic approach.
 
         Args:
             approach (TherapeuticApproach): The therapeutic approach to filter by
 
         Returns:
-            List[PsychologicalExpert]: List of experts using the specified approach
+            Tuple[PsychologicalExpert, ...]: Experts using the specified approach
         """
-        return [
-            expert
-            for expert in self._experts
-            if expert.uses_therapeutic_approach(approach)
-        ]
+        return self._by_approach.get(approach, ())
 
     def get_experts_for_session_type(
         self, session_type: SessionType
-    ) -> List[PsychologicalExpert]:
+    ) -> Tuple[PsychologicalExpert, ...]:
         """Get all experts qualified to handle a specific session type.
 
         Args:
             session_type (SessionType): The session type to filter by
 
         Returns:
-            List[PsychologicalExpert]: List of experts qualified for the session type
+            Tuple[PsychologicalExpert, ...]: Experts qualified for the session type
         """
-        return [
-            expert
-            for expert in self._experts
-            if expert.can_handle_session_type(session_type)
-        ]
+        return self._by_session_type.get(session_type, ())
 
-    def get_all_experts(self) -> List[PsychologicalExpert]:
+    def get_all_experts(self) -> Tuple[PsychologicalExpert, ...]:
         """Get all available experts.
 
         Returns:
-            List[PsychologicalExpert]: List of all experts
+            Tuple[PsychologicalExpert, ...]: Read-only sequence of all experts
+        """
+        return self._experts_tuple
+
+    def filter_experts(
+        self,
+        specialization: Optional[SpecializationArea] = None,
+        approach: Optional[TherapeuticApproach] = None,
+        session_type: Optional[SessionType] = None,
+    ) -> Tuple[PsychologicalExpert, ...]:
+        """Get experts matching all of the given criteria.
+
+        Expert data does not change after loading, so results are memoized per
+        combination of criteria.
+
+        Args:
+            specialization (Optional[SpecializationArea]): Specialization to filter by
+            approach (Optional[TherapeuticApproach]): Therapeutic approach to filter by
+            session_type (Optional[SessionType]): Session type to filter by
+
+        Returns:
+            Tuple[PsychologicalExpert, ...]: Experts matching every given criterion
         """
-        return self._experts.copy() 
\ No newline at end of file
+        key = (specialization, approach, session_type)
+        experts = self._filter_cache.get(key)
+        if experts is None:
+            experts = self._experts_tuple
+            if specialization:
+                experts = [e for e in experts if e.has_specialization(specialization)]
+            if approach:
+                experts = [e for e in experts if e.uses_therapeutic_approach(approach)]
+            if session_type:
+                experts = [
+                    e for e in experts if e.can_handle_session_type(session_type)
+                ]
+            experts = tuple(experts)
+            self._filter_cache[key] = experts
+        return experts
@@ -1,26 +1,152 @@
+import textwrap
+import threading
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
+
 import opik
+import orjson
+from jinja2 import Environment, Template, Undefined
 from loguru import logger
 
+from .psychological_expert import PsychologicalExpert, SessionType
 
-class Prompt:
-    def __init__(self, name: str, prompt: str) -> None:
-        self.name = name
 
+class _KeepPlaceholder(Undefined):
+    """Renders a variable that was not supplied back as its placeholder."""
+
+    def __str__(self) -> str:
+        return "{{%s}}" % self._undefined_name
+
+
+_PLACEHOLDER_MARK = "\x00"
+
+
+class _MarkPlaceholder(Undefined):
+    """Renders a variable that was not supplied as a marker character."""
+
+    def __str__(self) -> str:
+        return _PLACEHOLDER_MARK
+
+# Shared environment for compiling prompt templates; prompts are module
+# constants, so each template is compiled exactly once at import
+_ENV = Environment(auto_reload=False)
+# Environment for partial rendering, which leaves unsupplied placeholders intact
+_PARTIAL_ENV = Environment(auto_reload=False, undefined=_KeepPlaceholder)
+# Environment for locating the first placeholder a partial leaves unfilled
+_MARK_ENV = Environment(auto_reload=False, undefined=_MarkPlaceholder)
+
+# Whether Opik is usable, probed on first prompt access rather than at import
+_OPIK_OK: Optional[bool] = None
+_opik_lock = threading.Lock()
+
+
+def _opik_ok() -> bool:
+    """Check Opik credentials once per process. Call with ``_opik_lock`` held."""
+    global _OPIK_OK
+    if _OPIK_OK is None:
         try:
-            self.__prompt = opik.Prompt(name=name, prompt=prompt)
+            opik.Opik().auth_check()
+            _OPIK_OK = True
         except Exception:
             logger.warning(
-                "Can't use Opik to version the prompt (probably due to missing or invalid credentials). Falling back to local prompt. The prompt is not versioned, but it's still usable."
+                "Can't use Opik to version the prompts (probably due to missing or invalid credentials). Falling back to local prompts. The prompts are not versioned, but they're still usable."
             )
-            self.__prompt = prompt
+            _OPIK_OK = False
+    return _OPIK_OK
+
+
+def _prep(prompt: str) -> str:
+    """Normalize a prompt literal once at import: dedent and strip it."""
+    return textwrap.dedent(prompt).strip()
+
+
+class Prompt:
+    def __init__(
+        self,
+        name: str,
+        prompt: str,
+        versioned: bool = True,
+        fixed: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.name = name
+        self._compiled: Template = _ENV.from_string(prompt)
+
+        # Values bound by partial(). They are passed to the template on every
+        # render rather than spliced into its source, so template syntax in a
+        # value (e.g. "{{" in an expert's name) is never interpreted.
+        self._fixed: Dict[str, Any] = dict(fixed) if fixed else {}
+
+        # Text before the first placeholder is identical across renders, so LLM
+        # providers can cache it (e.g. an Anthropic cache_control breakpoint).
+        # Routing requests by prompt_cache_key keeps identical prefixes together.
+        if self._fixed:
+            text = _PARTIAL_ENV.from_string(prompt).render(self._fixed)
+            marked = _MARK_ENV.from_string(prompt).render(self._fixed)
+            placeholder_start = marked.find(_PLACEHOLDER_MARK)
+        else:
+            text = prompt
+            placeholder_start = prompt.find("{{")
+        self.cacheable_prefix_len = (
+            placeholder_start if placeholder_start != -1 else len(text)
+        )
+        self.prompt_cache_key = name
+
+        # Versioned with Opik lazily, on first access to `prompt`
+        self.__source = prompt
+        self.__local_prompt = text
+        self.__prompt: Union[opik.Prompt, str, None] = None if versioned else text
+        self.__prompt_utf8: Optional[bytes] = None
+
+    def __load_prompt(self) -> Union[opik.Prompt, str]:
+        if _opik_ok():
+            try:
+                return opik.Prompt(name=self.name, prompt=self.__local_prompt)
+            except Exception:
+                logger.warning(
+                    "Can't use Opik to version the prompt (probably due to missing or invalid credentials). Falling back to local prompt. The prompt is not versioned, but it's still usable."
+                )
+        return self.__local_prompt
 
     @property
     def prompt(self) -> str:
+        if self.__prompt is None:
+            with _opik_lock:
+                if self.__prompt is None:
+                    self.__prompt = self.__load_prompt()
+
         if isinstance(self.__prompt, opik.Prompt):
             return self.__prompt.prompt
         else:
             return self.__prompt
 
+    @property
+    def prompt_bytes(self) -> bytes:
+        if self.__prompt_utf8 is None:
+            self.__prompt_utf8 = self.prompt.encode("utf-8")
+        return self.__prompt_utf8
+
+    def render(self, **variables: Any) -> str:
+        if self._fixed:
+            variables = {**variables, **self._fixed}
+        return self._compiled.render(variables)
+
+    def partial(self, **fixed: Any) -> "Prompt":
+        """Fill in some placeholders, leaving the rest for a later render().
+
+        Results are memoized per prompt and set of values. The returned prompt
+        is not versioned with Opik.
+        """
+        return self._partial(frozenset((k, str(v)) for k, v in fixed.items()))
+
+    @lru_cache(maxsize=256)
+    def _partial(self, fixed: FrozenSet[Tuple[str, str]]) -> "Prompt":
+        return Prompt(
+            name=self.name,
+            prompt=self.__source,
+            versioned=False,
+            fixed={**self._fixed, **dict(fixed)},
+        )
+
     def __str__(self) -> str:
         return self.prompt
 
@@ -33,15 +159,7 @@ class Prompt:
 # --- Initial Assessment ---
 
 __INITIAL_ASSESSMENT_PROMPT = """
-You are {{expert_name}}, a psychological expert specializing in {{specializations}}.
-You are conducting an initial assessment session with a new client.
-
-Your therapeutic approaches are: {{therapeutic_approaches}}
-Your communication style is: {{communication_style}}
-Your ethical guidelines are: {{ethical_guidelines}}
-
-Session Protocol:
-{{session_protocol}}
+You are a psychological expert conducting an initial assessment session with a new client.
 
 Guidelines:
 1. Begin by introducing yourself and explaining the purpose of the initial assessment
@@ -61,32 +179,26 @@ Remember:
 - Document key information for future sessions
 - Be prepared to provide appropriate referrals if needed
 
+Your name is {{expert_name}} and you specialize in {{specializations}}.
+Your therapeutic approaches are: {{therapeutic_approaches}}
+Your communication style is: {{communication_style}}
+Your ethical guidelines are: {{ethical_guidelines}}
+
+Session Protocol:
+{{session_protocol}}
+
 The initial assessment session begins now.
 """
 
 INITIAL_ASSESSMENT_PROMPT = Prompt(
     name="initial_assessment_prompt",
-    prompt=__INITIAL_ASSESSMENT_PROMPT,
+    prompt=_prep(__INITIAL_ASSESSMENT_PROMPT),
 )
 
 # --- Regular Session ---
 
 __REGULAR_SESSION_PROMPT = """
-You are {{expert_name}}, a psychological expert specializing in {{specializations}}.
-You are conducting a regular therapy session with an existing client.
-
-Your therapeutic approaches are: {{therapeutic_approaches}}
-Your communication style is: {{communication_style}}
-Your ethical guidelines are: {{ethical_guidelines}}
-
-Session Protocol:
-{{session_protocol}}
-
-Previous Session Summary:
-{{previous_session_summary}}
-
-Current Treatment Goals:
-{{treatment_goals}}
+You are a psychological expert conducting a regular therapy session with an existing client.
 
 Guidelines:
 1. Begin by checking in with the client about their current state
@@ -105,29 +217,32 @@ Remember:
 - Document session progress and any concerns
 - Be prepared to adjust treatment plan if needed
 
+Your name is {{expert_name}} and you specialize in {{specializations}}.
+Your therapeutic approaches are: {{therapeutic_approaches}}
+Your communication style is: {{communication_style}}
+Your ethical guidelines are: {{ethical_guidelines}}
+
+Session Protocol:
+{{session_protocol}}
+
+Previous Session Summary:
+{{previous_session_summary}}
+
+Current Treatment Goals:
+{{treatment_goals}}
+
 The regular session begins now.
 """
 
 REGULAR_SESSION_PROMPT = Prompt(
     name="regular_session_prompt",
-    prompt=__REGULAR_SESSION_PROMPT,
+    prompt=_prep(__REGULAR_SESSION_PROMPT),
 )
 
 # --- Crisis Intervention ---
 
 __CRISIS_INTERVENTION_PROMPT = """
-You are {{expert_name}}, a psychological expert specializing in {{specializations}}.
-You are conducting a crisis intervention session.
-
-Your therapeutic approaches are: {{therapeutic_approaches}}
-Your communication style is: {{communication_style}}
-Your ethical guidelines are: {{ethical_guidelines}}
-
-Session Protocol:
-{{session_protocol}}
-
-Client's Current Crisis:
-{{crisis_description}}
+You are a psychological expert conducting a crisis intervention session.
 
 Guidelines:
 1. Immediately assess for safety and risk
@@ -147,32 +262,29 @@ Remember:
 - Document all actions taken
 - Ensure proper follow-up care
 
+Your name is {{expert_name}} and you specialize in {{specializations}}.
+Your therapeutic approaches are: {{therapeutic_approaches}}
+Your communication style is: {{communication_style}}
+Your ethical guidelines are: {{ethical_guidelines}}
+
+Session Protocol:
+{{session_protocol}}
+
+Client's Current Crisis:
+{{crisis_description}}
+
 The crisis intervention session begins now.
 """
 
 CRISIS_INTERVENTION_PROMPT = Prompt(
     name="crisis_intervention_prompt",
-    prompt=__CRISIS_INTERVENTION_PROMPT,
+    prompt=_prep(__CRISIS_INTERVENTION_PROMPT),
 )
 
 # --- Progress Evaluation ---
 
 __PROGRESS_EVALUATION_PROMPT = """
-You are {{expert_name}}, a psychological expert specializing in {{specializations}}.
-You are conducting a progress evaluation session.
-
-Your therapeutic approaches are: {{therapeutic_approaches}}
-Your communication style is: {{communication_style}}
-Your ethical guidelines are: {{ethical_guidelines}}
-
-Session Protocol:
-{{session_protocol}}
-
-Treatment History:
-{{treatment_history}}
-
-Original Goals:
-{{original_goals}}
+You are a psychological expert conducting a progress evaluation session.
 
 Guidelines:
 1. Review progress towards treatment goals
@@ -191,10 +303,60 @@ Remember:
 - Document progress and any changes
 - Maintain therapeutic alliance
 
+Your name is {{expert_name}} and you specialize in {{specializations}}.
+Your therapeutic approaches are: {{therapeutic_approaches}}
+Your communication style is: {{communication_style}}
+Your ethical guidelines are: {{ethical_guidelines}}
+
+Session Protocol:
+{{session_protocol}}
+
+Treatment History:
+{{treatment_history}}
+
+Original Goals:
+{{original_goals}}
+
 The progress evaluation session begins now.
 """
 
 PROGRESS_EVALUATION_PROMPT = Prompt(
     name="progress_evaluation_prompt",
-    prompt=__PROGRESS_EVALUATION_PROMPT,
-) 
\ No newline at end of file
+    prompt=_prep(__PROGRESS_EVALUATION_PROMPT),
+) 
+
+SESSION_PROMPTS: Dict[SessionType, Prompt] = {
+    SessionType.INITIAL_ASSESSMENT: INITIAL_ASSESSMENT_PROMPT,
+    SessionType.REGULAR_SESSION: REGULAR_SESSION_PROMPT,
+    SessionType.CRISIS_INTERVENTION: CRISIS_INTERVENTION_PROMPT,
+    SessionType.PROGRESS_EVALUATION: PROGRESS_EVALUATION_PROMPT,
+}
+
+
+def get_expert_prompt(
+    expert: PsychologicalExpert, session_type: SessionType
+) -> Optional[Prompt]:
+    """Get a session prompt with the expert's own placeholders filled in.
+
+    Only the session-specific placeholders (e.g. {{crisis_description}}) are
+    left for render(). Partial prompts are memoized, so each expert's is built
+    once per session type. Returns None if there is no prompt for the session
+    type or the expert has no protocol for it.
+    """
+    prompt = SESSION_PROMPTS.get(session_type)
+    if prompt is None:
+        return None
+    protocol = expert.get_session_protocol(session_type)
+    if protocol is None:
+        return None
+
+    return prompt.partial(
+        expert_name=expert.name,
+        specializations=", ".join(s.value for s in expert.specializations),
+        therapeutic_approaches=", ".join(
+            t.value for t in expert.therapeutic_approaches
+        ),
+        communication_style=expert.communication_style,
+        ethical_guidelines=expert.ethical_guidelines,
+        session_protocol=orjson.dumps(protocol, option=orjson.OPT_INDENT_2).decode(),
+    )
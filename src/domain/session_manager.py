@@ -1,12 +1,45 @@
+import sys
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Annotated, Any, Callable, Deque, Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    PrivateAttr,
+    TypeAdapter,
+)
 
 from .psychological_expert import PsychologicalExpert, SessionType
 
 
+_FLOAT_LIST = TypeAdapter(List[float])
+
+
+def _to_metric_series(value: Any) -> array:
+    """Coerce a sequence of numbers to a packed float64 array."""
+    if isinstance(value, array) and value.typecode == "d":
+        return value
+    # Validate as a float list first so bad input fails as a ValidationError
+    return array("d", _FLOAT_LIST.validate_python(value))
+
+
+# A metric's values packed as C doubles rather than a list of float objects.
+# The array supports the buffer protocol, so numeric code can view it without
+# copying (e.g. numpy.frombuffer); it serializes as a plain list of floats.
+MetricSeries = Annotated[
+    array,
+    PlainValidator(_to_metric_series),
+    PlainSerializer(lambda series: series.tolist(), return_type=List[float]),
+]
+
+
 class SessionState(BaseModel):
     """Represents the current state of a therapy session."""
     session_id: str = Field(default_factory=lambda: str(uuid4()))
@@ -23,23 +56,120 @@ class SessionState(BaseModel):
     homework_assigned: List[str] = Field(default_factory=list)
     session_summary: Optional[str] = None
 
+    # Bumped once per progress update; cached views are tagged with it
+    _version: int = PrivateAttr(default=0)
+    _view_cache: Optional[Tuple[int, Callable[..., Any], Any]] = PrivateAttr(
+        default=None
+    )
+
+    def cached_view(self, build: Callable[["SessionState"], Any]) -> Any:
+        """Get ``build(self)``, cached until the session's progress next changes.
+
+        A single view is cached per session, keyed by the builder and the
+        session's version. The result is shared and must not be modified.
+        """
+        cached = self._view_cache
+        version = self._version
+        if cached is None or cached[0] != version or cached[1] is not build:
+            cached = (version, build, build(self))
+            self._view_cache = cached
+        return cached[2]
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the session to JSON bytes with pydantic-core's serializer."""
+        return self.__pydantic_serializer__.to_json(self)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRecord:
+    """Immutable snapshot of a completed session, as kept in client history.
+
+    Slotted and free of pydantic bookkeeping, so long histories stay compact.
+    """
+    session_id: str
+    expert_id: str
+    client_id: str
+    session_type: SessionType
+    start_time: datetime
+    end_time: Optional[datetime]
+    current_focus: str
+    progress_notes: Tuple[str, ...]
+    risk_level: int
+    completed_steps: Tuple[str, ...]
+    next_steps: Tuple[str, ...]
+    homework_assigned: Tuple[str, ...]
+    session_summary: Optional[str]
+
+    @classmethod
+    def from_session(cls, session: SessionState) -> "SessionRecord":
+        """Snapshot a session state."""
+        return cls(
+            session_id=session.session_id,
+            expert_id=session.expert_id,
+            client_id=session.client_id,
+            session_type=session.session_type,
+            start_time=session.start_time,
+            end_time=session.end_time,
+            current_focus=session.current_focus,
+            progress_notes=tuple(session.progress_notes),
+            risk_level=session.risk_level,
+            completed_steps=tuple(session.completed_steps),
+            next_steps=tuple(session.next_steps),
+            homework_assigned=tuple(session.homework_assigned),
+            session_summary=session.session_summary,
+        )
+
 
 class ClientHistory(BaseModel):
     """Represents a client's therapy history."""
     client_id: str
-    sessions: List[SessionState] = Field(default_factory=list)
+    sessions: Deque[SessionRecord] = Field(default_factory=deque)
     treatment_goals: List[str] = Field(default_factory=list)
     risk_assessments: List[Dict] = Field(default_factory=list)
-    progress_metrics: Dict[str, List[float]] = Field(default_factory=dict)
+    progress_metrics: Dict[str, MetricSeries] = Field(default_factory=dict)
     emergency_contacts: List[Dict] = Field(default_factory=list)
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the history to JSON bytes with pydantic-core's serializer."""
+        return self.__pydantic_serializer__.to_json(self)
+
 
 class SessionManager:
-    """Manages therapy sessions and client history."""
+    """Manages therapy sessions and client history.
 
-    def __init__(self):
+    Methods may be called concurrently from the API threadpool; all
+    mutations of the session and history stores happen under ``_lock``.
+    """
+
+    def __init__(self, max_history: Optional[int] = None):
+        """Initialize the session manager.
+
+        Args:
+            max_history: Maximum number of past sessions kept per client; the
+                oldest are dropped first. Unbounded if None.
+        """
         self._active_sessions: Dict[str, SessionState] = {}
         self._client_histories: Dict[str, ClientHistory] = {}
+        self._max_history = max_history
+        self._lock = threading.Lock()
+
+    def _hist(self, client_id: str) -> ClientHistory:
+        """Get a client's history, creating an empty one if there is none.
+
+        Must be called with ``_lock`` held.
+        """
+        history = self._client_histories.get(client_id)
+        if history is None:
+            history = ClientHistory.model_construct(
+                client_id=client_id,
+                sessions=deque(maxlen=self._max_history),
+                treatment_goals=[],
+                risk_assessments=[],
+                progress_metrics={},
+                emergency_contacts=[],
+            )
+            self._client_histories[client_id] = history
+        return history
 
     def start_session(
         self,
@@ -59,13 +189,25 @@ class SessionManager:
         Returns:
             SessionState: The created session state
         """
-        session = SessionState(
-            expert_id=expert.id,
-            client_id=client_id,
+        # Inputs were validated at the API boundary, so skip re-validation.
+        # IDs are interned so retained sessions share one copy of each string.
+        session = SessionState.model_construct(
+            session_id=str(uuid4()),
+            expert_id=sys.intern(expert.id),
+            client_id=sys.intern(client_id),
             session_type=session_type,
+            start_time=datetime.now(),
+            end_time=None,
             current_focus=initial_focus,
+            progress_notes=[],
+            risk_level=0,
+            completed_steps=[],
+            next_steps=[],
+            homework_assigned=[],
+            session_summary=None,
         )
-        self._active_sessions[session.session_id] = session
+        with self._lock:
+            self._active_sessions[session.session_id] = session
         return session
 
     def end_session(self, session_id: str, summary: str) -> SessionState:
@@ -78,22 +220,21 @@ class SessionManager:
         Returns:
             SessionState: The completed session state
         """
-        if session_id not in self._active_sessions:
-            raise ValueError(f"Session {session_id} not found")
+        with self._lock:
+            if session_id not in self._active_sessions:
+                raise ValueError(f"Session {session_id} not found")
 
-        session = self._active_sessions[session_id]
-        session.end_time = datetime.now()
-        session.session_summary = summary
+            session = self._active_sessions[session_id]
+            session.end_time = datetime.now()
+            session.session_summary = summary
 
-        # Update client history
-        if session.client_id not in self._client_histories:
-            self._client_histories[session.client_id] = ClientHistory(
-                client_id=session.client_id
+            # Update client history
+            self._hist(session.client_id).sessions.append(
+                SessionRecord.from_session(session)
             )
-        self._client_histories[session.client_id].sessions.append(session)
 
-        # Remove from active sessions
-        del self._active_sessions[session_id]
+            # Remove from active sessions
+            del self._active_sessions[session_id]
         return session
 
     def update_session_progress(
@@ -118,20 +259,35 @@ class SessionManager:
         Returns:
             SessionState: The updated session state
         """
-        if session_id not in self._active_sessions:
-            raise ValueError(f"Session {session_id} not found")
-
-        session = self._active_sessions[session_id]
-        session.progress_notes.append(progress_note)
-
-        if risk_level is not None:
-            session.risk_level = risk_level
-        if completed_step:
-            session.completed_steps.append(completed_step)
-        if next_step:
-            session.next_steps.append(next_step)
-        if homework:
-            session.homework_assigned.append(homework)
+        with self._lock:
+            if session_id not in self._active_sessions:
+                raise ValueError(f"Session {session_id} not found")
+
+            session = self._active_sessions[session_id]
+
+            # Build replacement lists rather than appending in place, so a reader
+            # iterating one of the old lists never sees it grow. Readers don't
+            # take the lock and may still see some fields updated before
+            # others; the single version bump only ensures the cached view
+            # is rebuilt once per update and never served stale afterwards
+            progress_notes = session.progress_notes + [progress_note]
+            completed_steps = session.completed_steps
+            if completed_step:
+                completed_steps = completed_steps + [completed_step]
+            next_steps = session.next_steps
+            if next_step:
+                next_steps = next_steps + [next_step]
+            homework_assigned = session.homework_assigned
+            if homework:
+                homework_assigned = homework_assigned + [homework]
+
+            session.progress_notes = progress_notes
+            session.completed_steps = completed_steps
+            session.next_steps = next_steps
+            session.homework_assigned = homework_assigned
+            if risk_level is not None:
+                session.risk_level = risk_level
+            session._version += 1
 
         return session
 
@@ -142,10 +298,41 @@ class SessionManager:
             client_id: The client's unique identifier
 
         Returns:
-            Optional[ClientHistory]: The client's history if found
+            Optional[ClientHistory]: The client's history if found; use
+                ClientHistory.to_json_bytes() to serialize it
         """
         return self._client_histories.get(client_id)
 
+    def get_client_history_snapshot(self, client_id: str) -> Optional[ClientHistory]:
+        """Get a point-in-time copy of a client's therapy history.
+
+        The copy is taken under the manager's lock and shares no mutable
+        containers with the stored history, so it can be read at leisure.
+
+        Args:
+            client_id: The client's unique identifier
+
+        Returns:
+            Optional[ClientHistory]: A copy of the client's history if found
+        """
+        with self._lock:
+            history = self._client_histories.get(client_id)
+            if history is None:
+                return None
+            # Session records are immutable and assessments are only appended,
+            # so copying the containers is enough
+            return ClientHistory.model_construct(
+                client_id=history.client_id,
+                sessions=deque(history.sessions),
+                treatment_goals=list(history.treatment_goals),
+                risk_assessments=list(history.risk_assessments),
+                progress_metrics={
+                    name: array("d", series)
+                    for name, series in history.progress_metrics.items()
+                },
+                emergency_contacts=list(history.emergency_contacts),
+            )
+
     def update_treatment_goals(
         self, client_id: str, goals: List[str]
     ) -> ClientHistory:
@@ -158,10 +345,10 @@ class SessionManager:
         Returns:
             ClientHistory: The updated client history
         """
-        if client_id not in self._client_histories:
-            self._client_histories[client_id] = ClientHistory(client_id=client_id)
-        self._client_histories[client_id].treatment_goals = goals
-        return self._client_histories[client_id]
+        with self._lock:
+            history = self._hist(client_id)
+            history.treatment_goals = goals
+            return history
 
     def add_risk_assessment(
         self, client_id: str, assessment: Dict
@@ -175,10 +362,10 @@ class SessionManager:
         Returns:
             ClientHistory: The updated client history
         """
-        if client_id not in self._client_histories:
-            self._client_histories[client_id] = ClientHistory(client_id=client_id)
-        self._client_histories[client_id].risk_assessments.append(assessment)
-        return self._client_histories[client_id]
+        with self._lock:
+            history = self._hist(client_id)
+            history.risk_assessments.append(assessment)
+            return history
 
     def update_progress_metrics(
         self, client_id: str, metric_name: str, value: float
@@ -193,20 +380,23 @@ class SessionManager:
         Returns:
             ClientHistory: The updated client history
         """
-        if client_id not in self._client_histories:
-            self._client_histories[client_id] = ClientHistory(client_id=client_id)
-        if metric_name not in self._client_histories[client_id].progress_metrics:
-            self._client_histories[client_id].progress_metrics[metric_name] = []
-        self._client_histories[client_id].progress_metrics[metric_name].append(value)
-        return self._client_histories[client_id]
+        with self._lock:
+            history = self._hist(client_id)
+            series = history.progress_metrics.get(metric_name)
+            if series is None:
+                series = history.progress_metrics[metric_name] = array("d")
+            series.append(value)
+            return history
 
     def get_active_sessions(self) -> List[SessionState]:
         """Get all active sessions.
 
         Returns:
-            List[SessionState]: List of active sessions
+            List[SessionState]: List of active sessions; use
+                SessionState.to_json_bytes() to serialize each one
         """
-        return list(self._active_sessions.values())
+        with self._lock:
+            return list(self._active_sessions.values())
 
     def get_session(self, session_id: str) -> Optional[SessionState]:
         """Get a specific session by ID.
@@ -0,0 +1,13 @@
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from .api.routes import router
+
+app = FastAPI(
+    title="Psychological Expert System",
+    default_response_class=ORJSONResponse,
+)
+# Compress larger payloads such as long client histories
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+app.include_router(router, default_response_class=ORJSONResponse)
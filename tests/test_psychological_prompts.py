@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("opik")
+pytest.importorskip("loguru")
+
+from src.domain.psychological_expert import (  # noqa: E402
+    PsychologicalExpert,
+    SessionType,
+    SpecializationArea,
+    TherapeuticApproach,
+)
+from src.domain.psychological_prompts import get_expert_prompt  # noqa: E402
+
+BRACED_NAME = "Dr {{A}} {% if x %} {# note #}"
+
+
+@pytest.fixture
+def expert() -> PsychologicalExpert:
+    return PsychologicalExpert(
+        id="braces",
+        name=BRACED_NAME,
+        specializations=[SpecializationArea.DEPRESSION],
+        therapeutic_approaches=[TherapeuticApproach.COGNITIVE_BEHAVIORAL],
+        communication_style="direct",
+        ethical_guidelines="{{ethical_guidelines}}",
+        session_protocols={SessionType.CRISIS_INTERVENTION.value: {"steps": [1]}},
+    )
+
+
+def test_partial_keeps_template_syntax_in_values_literal(expert):
+    prompt = get_expert_prompt(expert, SessionType.CRISIS_INTERVENTION)
+
+    assert BRACED_NAME in prompt.prompt
+    assert "{{crisis_description}}" in prompt.prompt
+
+    rendered = prompt.render(crisis_description="client in distress")
+    assert BRACED_NAME in rendered
+    assert "{{ethical_guidelines}}" in rendered
+    assert "client in distress" in rendered
+
+
+def test_partial_prefix_ends_at_first_unfilled_placeholder(expert):
+    prompt = get_expert_prompt(expert, SessionType.CRISIS_INTERVENTION)
+
+    prefix = prompt.prompt[: prompt.cacheable_prefix_len]
+    assert prompt.prompt[prompt.cacheable_prefix_len :].startswith(
+        "{{crisis_description}}"
+    )
+    assert prompt.render(crisis_description="x").startswith(prefix)
+
+
+def test_expert_prompt_formats_protocol_as_json(expert):
+    prompt = get_expert_prompt(expert, SessionType.CRISIS_INTERVENTION)
+
+    assert '"steps": [\n    1\n  ]' in prompt.prompt
+    assert "{'steps'" not in prompt.prompt
+
+
+def test_expert_prompt_requires_protocol_for_session_type(expert):
+    assert get_expert_prompt(expert, SessionType.INITIAL_ASSESSMENT) is None